@@ -3,6 +3,7 @@
 from .agent_configs import (
     get_agent_config,
     get_system_prompt,
+    get_system_prompt_parts,
     process_agent_result,
     AGENT_CONFIGS
 )
@@ -10,6 +11,7 @@ from .agent_configs import (
 __all__ = [
     "get_agent_config",
     "get_system_prompt",
+    "get_system_prompt_parts",
     "process_agent_result",
     "AGENT_CONFIGS"
 ]
\ No newline at end of file
@@ -1,11 +1,27 @@
 """Agent configurations with prompts, formats, and context processing."""
 
-from typing import Dict, Callable, Any
-from datetime import datetime
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, Callable, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def cached_system_prompt(text: str) -> list:
+    """System prompt content blocks ending in a Bedrock cache point.
+    
+    Pass as Agent(system_prompt=...) so the static prompt prefix is cached
+    across requests; the prompt text must not vary per investigation.
+    """
+    return [{"text": text}, {"cachePoint": {"type": "default"}}]
+
 
 class AgentConfig:
     """Configuration for a specialized agent."""
     
+    __slots__ = ("agent_type", "system_prompt", "output_format", "process_result")
+    
     def __init__(
         self,
         agent_type: str,
@@ -216,19 +232,50 @@ Base your analysis on evidence from logs, metrics, and resource data. Be definit
 }
 
 
+@lru_cache(maxsize=None)
 def get_agent_config(agent_type: str) -> AgentConfig:
     """Get configuration for an agent type."""
     return AGENT_CONFIGS.get(agent_type)
 
 
-def get_system_prompt(agent_type: str, investigation_id: str) -> str:
-    """Get system prompt for an agent with current time."""
+_last_utc = [0, ""]
+
+
+def _now_utc() -> str:
+    """Current UTC time string, formatted at most once per second."""
+    now = int(time.time())
+    if now != _last_utc[0]:
+        _last_utc[1] = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(now))
+        _last_utc[0] = now
+    return _last_utc[1]
+
+
+@lru_cache(maxsize=16)
+def _prompt_prefix(agent_type: str) -> str:
+    """Static part of the system prompt for an agent type."""
     config = get_agent_config(agent_type)
     if not config:
         return f"You are {agent_type}. Use available tools to complete the task."
+    return config.system_prompt
+
+
+def get_system_prompt_parts(agent_type: str, investigation_id: str) -> Tuple[str, str]:
+    """Get the system prompt as (static prefix, per-call suffix).
+    
+    The prefix only depends on the agent type, so it can be marked as a
+    prompt cache point. The suffix carries the current time and investigation ID.
+    """
+    suffix = "".join(["Current time is ", _now_utc(), ".\n\nInvestigation ID: ", investigation_id])
+    return _prompt_prefix(agent_type), suffix
+
+
+def get_system_prompt(agent_type: str, investigation_id: str) -> str:
+    """Get system prompt for an agent with current time."""
+    if not get_agent_config(agent_type):
+        return _prompt_prefix(agent_type)
     
-    current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
-    return f"Current time is {current_time}.\n\nInvestigation ID: {investigation_id}\n\n{config.system_prompt}"
+    prefix, suffix = get_system_prompt_parts(agent_type, investigation_id)
+    return "".join([prefix, "\n\n", suffix])
 
 
 def process_agent_result(agent_type: str, result: Dict) -> Dict:
@@ -240,5 +287,5 @@ def process_agent_result(agent_type: str, result: Dict) -> Dict:
     try:
         return config.process_result(result)
     except Exception as e:
-        print(f"⚠️  Error processing result for {agent_type}: {e}")
+        logger.warning("Error processing result for %s: %s", agent_type, e)
         return result
@@ -1,30 +1,63 @@
 """AIOps AgentCore Runtime Entry Point"""
 
+from typing import TYPE_CHECKING
 from bedrock_agentcore import BedrockAgentCoreApp
-from .orchestrator.brain_agent import BrainAgent
-from .orchestrator.executor_agent import ExecutorAgent
 from .models.enums import MessageType
 
+if TYPE_CHECKING:
+    from .orchestrator.brain_agent import BrainAgent
+    from .orchestrator.executor_agent import ExecutorAgent
+
 app = BedrockAgentCoreApp()
 
+_MSG_ALARM = MessageType.ALARM.value
+_MSG_EXECUTION = MessageType.EXECUTION.value
+_MSG_RE_EVALUATE = "RE_EVALUATE"
+
+# Agents are reused across invocations in the same runtime process and are
+# imported on first use, so each branch only pays for the modules it needs
+_brain = None
+_executor = None
+
+
+def _get_brain() -> "BrainAgent":
+    global _brain
+    if _brain is None:
+        from .orchestrator.brain_agent import BrainAgent
+        _brain = BrainAgent()
+    return _brain
+
+
+def _get_executor() -> "ExecutorAgent":
+    global _executor
+    if _executor is None:
+        from .orchestrator.executor_agent import ExecutorAgent
+        _executor = ExecutorAgent()
+    return _executor
+
+
 @app.entrypoint
-def invoke(payload):
-    """Route messages to Brain or Executor based on message_type."""
-    message_type = payload.get("message_type", MessageType.ALARM.value)
+async def invoke(payload):
+    """Route messages to Brain or Executor based on message_type.
+    
+    Blocking Bedrock work runs in worker threads, so the runtime can serve
+    several investigations concurrently.
+    """
+    message_type = payload.get("message_type", _MSG_ALARM)
     
-    if message_type == MessageType.EXECUTION.value:
+    if message_type == _MSG_EXECUTION:
         investigation_id = payload.get("investigation_id")
-        executor = ExecutorAgent()
-        result = executor.execute_workflow(investigation_id)
+        executor = _get_executor()
+        result = await executor.execute_workflow_async(investigation_id)
         return {
             "investigation_id": investigation_id,
             "status": "execution_ongoing",
             "result": result
         }
-    elif message_type == "RE_EVALUATE":
+    elif message_type == _MSG_RE_EVALUATE:
         investigation_id = payload.get("investigation_id")
-        brain = BrainAgent()
-        result = brain.re_evaluate_workflow(investigation_id)
+        brain = _get_brain()
+        result = await brain.re_evaluate_workflow_async(investigation_id)
         return {
             "investigation_id": investigation_id,
             "status": "re_evaluation_complete",
@@ -32,8 +65,8 @@ def invoke(payload):
         }
     else:
         alarm_text = payload.get("alarm", payload.get("prompt", ""))
-        brain = BrainAgent()
-        investigation_id = brain.process_alarm_text(alarm_text)
+        brain = _get_brain()
+        investigation_id = await brain.process_alarm_text_async(alarm_text)
         return {
             "investigation_id": investigation_id,
             "status": "investigation_triggered",
@@ -1,54 +1,7 @@
 """Data models for the AIOps Root Cause Analysis system"""
 
-from .data_models import (
-    AlarmInput,
-    Investigation,
-    InvestigationRound,
-    Evidence,
-    WorkflowStep,
-    ExecutionResult,
-    AnalysisReport,
-    RootCause,
-    EvaluationResult,
-    ConsolidatedFacts,
-    Fact,
-    Pattern,
-    Correlation,
-    InvestigationWorkflow,
-    ExecutionRequest,
-    ExecutionState,
-    InvestigationEvent,
-    FinalReport
-)
+from . import data_models, enums
+from .data_models import *
+from .enums import *
 
-from .enums import (
-    ExecutionStatus,
-    InvestigationStatus,
-    EvidenceType,
-    AgentType
-)
-
-__all__ = [
-    "AlarmInput",
-    "Investigation", 
-    "InvestigationRound",
-    "Evidence",
-    "WorkflowStep",
-    "ExecutionResult",
-    "AnalysisReport",
-    "RootCause",
-    "EvaluationResult",
-    "ConsolidatedFacts",
-    "Fact",
-    "Pattern",
-    "Correlation",
-    "InvestigationWorkflow",
-    "ExecutionRequest",
-    "ExecutionState",
-    "InvestigationEvent",
-    "FinalReport",
-    "ExecutionStatus",
-    "InvestigationStatus",
-    "EvidenceType",
-    "AgentType"
-]
\ No newline at end of file
+__all__ = data_models.__all__ + enums.__all__
@@ -1,12 +1,45 @@
 """Core data models for the AIOps Root Cause Analysis system"""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Set
 from .enums import ExecutionStatus, InvestigationStatus, EvidenceType, AgentType
 
-
-@dataclass
+__all__ = [
+    "AlarmInput",
+    "Investigation",
+    "InvestigationRound",
+    "Evidence",
+    "WorkflowStep",
+    "ExecutionResult",
+    "AnalysisReport",
+    "RootCause",
+    "EvaluationResult",
+    "ConsolidatedFacts",
+    "Fact",
+    "Pattern",
+    "Correlation",
+    "InvestigationWorkflow",
+    "ExecutionRequest",
+    "ExecutionState",
+    "InvestigationEvent",
+    "FinalReport"
+]
+
+_VALID_ALARM_STATES = frozenset({'OK', 'ALARM', 'INSUFFICIENT_DATA'})
+_VALID_COMPARISON_OPERATORS = frozenset({
+    'GreaterThanThreshold', 'GreaterThanOrEqualToThreshold',
+    'LessThanThreshold', 'LessThanOrEqualToThreshold'
+})
+
+
+def _intern(value):
+    """Intern low-cardinality strings so repeated values share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class AlarmInput:
     """AWS CloudWatch alarm input data"""
     alarm_name: str
@@ -23,29 +56,26 @@ class AlarmInput:
     timestamp: datetime
     region: str
     
+    def __post_init__(self):
+        """Intern fields that repeat across alarms (same region, namespace, ...)"""
+        self.namespace = _intern(self.namespace)
+        self.comparison_operator = _intern(self.comparison_operator)
+        self.alarm_state = _intern(self.alarm_state)
+        self.region = _intern(self.region)
+    
     def validate(self) -> bool:
         """Validate AWS CloudWatch alarm format"""
-        required_fields = [
-            'alarm_name', 'metric_name', 'namespace', 'threshold',
-            'comparison_operator', 'alarm_state', 'region'
-        ]
-        
         # Check required fields are not empty
-        for field_name in required_fields:
-            if not getattr(self, field_name):
-                return False
+        if not (self.alarm_name and self.metric_name and self.namespace and self.threshold
+                and self.comparison_operator and self.alarm_state and self.region):
+            return False
         
         # Validate alarm state
-        valid_states = ['OK', 'ALARM', 'INSUFFICIENT_DATA']
-        if self.alarm_state not in valid_states:
+        if self.alarm_state not in _VALID_ALARM_STATES:
             return False
             
         # Validate comparison operator
-        valid_operators = [
-            'GreaterThanThreshold', 'GreaterThanOrEqualToThreshold',
-            'LessThanThreshold', 'LessThanOrEqualToThreshold'
-        ]
-        if self.comparison_operator not in valid_operators:
+        if self.comparison_operator not in _VALID_COMPARISON_OPERATORS:
             return False
             
         # Validate numeric fields
@@ -55,7 +85,7 @@ class AlarmInput:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence collected during investigation"""
     evidence_id: str
@@ -69,9 +99,10 @@ class Evidence:
         """Validate evidence data after initialization"""
         if not 0.0 <= self.reliability_score <= 1.0:
             raise ValueError("Reliability score must be between 0.0 and 1.0")
+        self.source = _intern(self.source)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """Individual step in an investigation workflow"""
     step_id: str
@@ -79,14 +110,16 @@ class WorkflowStep:
     agent_type: AgentType
     required_data: List[str]
     expected_output: str
-    dependencies: List[str] = field(default_factory=list)
+    # Read-mostly sequences default to the shared empty tuple rather than a
+    # per-instance list; assign a new list/tuple to add items
+    dependencies: Sequence[str] = ()
     
     def validate(self) -> bool:
         """Validate workflow step data"""
         return bool(self.step_id and self.description and self.expected_output)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing a workflow step"""
     step_id: str
@@ -103,14 +136,14 @@ class ExecutionResult:
             raise ValueError("Confidence score must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationWorkflow:
     """Complete investigation workflow"""
     workflow_id: str
     steps: List[WorkflowStep]
     priority: str
     estimated_duration: int
-    required_tools: List[str] = field(default_factory=list)
+    required_tools: Sequence[str] = ()
     
     def validate(self) -> bool:
         """Validate workflow data"""
@@ -119,14 +152,14 @@ class InvestigationWorkflow:
         return all(step.validate() for step in self.steps)
 
 
-@dataclass
+@dataclass(slots=True)
 class RootCause:
     """Identified root cause candidate"""
     cause_id: str
     description: str
     probability: float
     supporting_evidence: List[str]
-    mitigation_steps: List[str] = field(default_factory=list)
+    mitigation_steps: Sequence[str] = ()
     
     def __post_init__(self):
         """Validate root cause data after initialization"""
@@ -134,7 +167,7 @@ class RootCause:
             raise ValueError("Probability must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationEvent:
     """Event that occurred during investigation"""
     event_id: str
@@ -145,7 +178,7 @@ class InvestigationEvent:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisReport:
     """Comprehensive analysis report from Brain Agent"""
     investigation_id: str
@@ -153,7 +186,7 @@ class AnalysisReport:
     supporting_evidence: List[Evidence]
     confidence_score: float
     investigation_timeline: List[InvestigationEvent]
-    recommendations: List[str] = field(default_factory=list)
+    recommendations: Sequence[str] = ()
     
     def __post_init__(self):
         """Validate analysis report data after initialization"""
@@ -161,7 +194,7 @@ class AnalysisReport:
             raise ValueError("Confidence score must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     """Consolidated fact from investigation"""
     fact_id: str
@@ -175,7 +208,7 @@ class Fact:
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     """Identified pattern in investigation data"""
     pattern_id: str
@@ -184,7 +217,7 @@ class Pattern:
     significance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Correlation:
     """Correlation between investigation elements"""
     correlation_id: str
@@ -199,7 +232,7 @@ class Correlation:
             raise ValueError("Correlation strength must be between -1.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedFacts:
     """Consolidated facts for new investigation round"""
     facts: List[Fact]
@@ -208,7 +241,7 @@ class ConsolidatedFacts:
     gaps: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalReport:
     """Final investigation report"""
     investigation_id: str
@@ -220,12 +253,12 @@ class FinalReport:
     rounds_completed: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of investigation evaluation"""
     investigation_complete: bool
     quality_score: float
-    missing_evidence: List[str] = field(default_factory=list)
+    missing_evidence: Sequence[str] = ()
     consolidated_facts: Optional[ConsolidatedFacts] = None
     final_report: Optional[FinalReport] = None
     
@@ -235,16 +268,16 @@ class EvaluationResult:
             raise ValueError("Quality score must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionState:
     """State of workflow execution"""
-    completed_steps: List[str] = field(default_factory=list)
-    failed_steps: List[str] = field(default_factory=list)
+    completed_steps: Set[str] = field(default_factory=set)
+    failed_steps: Set[str] = field(default_factory=set)
     current_step: Optional[str] = None
     aggregated_results: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRequest:
     """Request to execute workflow"""
     workflow: InvestigationWorkflow
@@ -252,7 +285,7 @@ class ExecutionRequest:
     execution_state: ExecutionState
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationRound:
     """Single round of investigation"""
     round_id: str
@@ -264,7 +297,7 @@ class InvestigationRound:
     end_time: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Investigation:
     """Complete investigation process"""
     investigation_id: str
@@ -273,7 +306,12 @@ class Investigation:
     current_round: int = 0
     status: InvestigationStatus = InvestigationStatus.INITIATED
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
+    
+    def __post_init__(self):
+        """Stamp updated_at from the same clock read as created_at"""
+        if self.updated_at is None:
+            self.updated_at = self.created_at
     
     def validate(self) -> bool:
         """Validate investigation data"""
@@ -2,6 +2,13 @@
 
 from enum import Enum
 
+__all__ = [
+    "ExecutionStatus",
+    "InvestigationStatus",
+    "EvidenceType",
+    "AgentType"
+]
+
 
 class MessageType(str, Enum):
     """SQS message types for different agent execution flows"""
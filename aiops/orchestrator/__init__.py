@@ -2,7 +2,6 @@
 
 from .base import BaseStrandsAgent, AgentState, SystemState
 from .interfaces import BrainAgentInterface, ExecutorAgentInterface, EvaluatorAgentInterface, StrandsAgentInterface
-from .brain_agent import BrainAgent
 
 __all__ = [
     "BaseStrandsAgent",
@@ -13,4 +12,13 @@ __all__ = [
     "EvaluatorAgentInterface",
     "StrandsAgentInterface",
     "BrainAgent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # BrainAgent pulls in its tool modules, so import it only when asked for;
+    # importing executor_agent or evaluator_agent does not load it
+    if name == "BrainAgent":
+        from .brain_agent import BrainAgent
+        return BrainAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,29 +1,43 @@
 """Base agent class and communication infrastructure using Strands framework"""
 
+import logging
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from ..models.enums import AgentType
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Set, Union
+from ..models.enums import AgentType, InvestigationStatus
 from ..models.data_models import Investigation
+from ..utils import json_utils
 
 try:
     from strands import Agent, tool
+    _NULL_AGENT = None
 except ImportError:
     # Fallback for development/testing without Strands
-    class Agent:
-        def __init__(self, system_prompt: str, tools: List = None, **kwargs):
-            self.system_prompt = system_prompt
-            self.tools = tools or []
-            
+    class _NullAgent:
+        """Stateless stand-in; one shared instance serves every agent"""
+        __slots__ = ()
+        
         def __call__(self, message: str, **kwargs) -> str:
-            return f"Mock response to: {message}"
+            return _MOCK_RESPONSE
+    
+    _MOCK_RESPONSE = "Mock response"
+    _NULL_AGENT = _NullAgent()
+    
+    def Agent(*args, **kwargs):
+        return _NULL_AGENT
     
     def tool(func):
         return func
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class AgentState:
     """State of an individual agent"""
     agent_id: str
@@ -40,26 +54,49 @@ class AgentState:
             raise ValueError("Load level must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemState:
     """Shared state across all agents"""
     active_investigations: Dict[str, Investigation] = field(default_factory=dict)
     agent_states: Dict[str, AgentState] = field(default_factory=dict)
     workflow_templates: Dict[str, Any] = field(default_factory=dict)
     confidence_thresholds: Dict[str, float] = field(default_factory=dict)
+    status_index: Dict[InvestigationStatus, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    
+    def _index_status(self, investigation: Investigation) -> None:
+        """Move investigation ID into the bucket for its current status"""
+        investigation_id = investigation.investigation_id
+        # One bucket per InvestigationStatus member, so this loop is bounded
+        for ids in self.status_index.values():
+            ids.discard(investigation_id)
+        self.status_index[investigation.status].add(investigation_id)
     
     def add_investigation(self, investigation: Investigation) -> None:
         """Add investigation to active investigations"""
         self.active_investigations[investigation.investigation_id] = investigation
+        self._index_status(investigation)
     
     def get_investigation(self, investigation_id: str) -> Optional[Investigation]:
         """Get investigation by ID"""
         return self.active_investigations.get(investigation_id)
     
-    def update_investigation(self, investigation: Investigation) -> None:
-        """Update investigation in shared state"""
-        investigation.updated_at = datetime.now()
+    def update_investigation(self, investigation: Investigation, now: Optional[datetime] = None) -> None:
+        """Update investigation in shared state.
+        
+        Pass ``now`` to reuse a timestamp already taken for the same event.
+        """
+        investigation.updated_at = now or datetime.now()
         self.active_investigations[investigation.investigation_id] = investigation
+        self._index_status(investigation)
+    
+    def iter_by_status(self, status: InvestigationStatus) -> Iterator[Investigation]:
+        """Iterate active investigations with the given status.
+        
+        The index is refreshed by add_investigation/update_investigation, so
+        status changes must go through update_investigation to be visible here.
+        """
+        for investigation_id in tuple(self.status_index.get(status, ())):
+            yield self.active_investigations[investigation_id]
     
     def register_agent(self, agent_state: AgentState) -> None:
         """Register agent in system state"""
@@ -70,6 +107,51 @@ class SystemState:
         return self.agent_states.get(agent_id)
 
 
+# Model config file locations, in lookup order
+_MODEL_CONFIG_PATHS = (
+    "config/model_config.json",
+    "model_config.json",
+    os.path.expanduser("~/.aiops/model_config.json"),
+    "/etc/aiops/model_config.json",
+)
+
+
+@lru_cache(maxsize=None)
+def _load_model_config_cached() -> Dict[str, Any]:
+    """Read model configuration once per process.
+    
+    The returned dict is shared between agents and must be treated as read-only.
+    """
+    for config_path in _MODEL_CONFIG_PATHS:
+        # A single open() per candidate: no exists() probe, no TOCTOU window
+        try:
+            with open(config_path, 'rb') as f:
+                config = json_utils.loads(f.read())
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.warning("Failed to load config from %s: %s", config_path, e)
+            continue
+        logger.info("Loaded model config from: %s", config_path)
+        return config
+    
+    # Fallback to default configuration
+    logger.info("Using default model configuration")
+    return {
+        "default_model": {
+            "provider": "bedrock",
+            "model_id": "apac.amazon.nova-pro-v1:0",
+            "region": "ap-southeast-1",
+            "cross_region_inference_enabled": True
+        },
+        "agent_models": {},
+        "fallback_models": [
+            "apac.amazon.nova-pro-v1:0",
+            "anthropic.claude-3-haiku-20240307-v1:0"
+        ]
+    }
+
+
 class BaseStrandsAgent(ABC):
     """Base class for Strands-based agents"""
     
@@ -79,6 +161,7 @@ class BaseStrandsAgent(ABC):
         self.system_state = system_state
         self.capabilities: List[str] = []
         self._strands_agent: Optional[Agent] = None
+        self._base_invocation_state: Optional[Dict[str, Any]] = None
         
         # Register agent in system state
         agent_state = AgentState(
@@ -92,6 +175,10 @@ class BaseStrandsAgent(ABC):
     def strands_agent(self) -> Agent:
         """Get or create the Strands Agent instance"""
         if self._strands_agent is None:
+            if _NULL_AGENT is not None:
+                # Without Strands, skip building prompt, tools and model
+                self._strands_agent = _NULL_AGENT
+                return self._strands_agent
             model_config = self._load_model_config()
             model = self._create_model_from_config(model_config)
             
@@ -104,43 +191,7 @@ class BaseStrandsAgent(ABC):
     
     def _load_model_config(self) -> Dict[str, Any]:
         """Load model configuration from file"""
-        import json
-        import os
-        
-        # Try multiple config file locations
-        config_paths = [
-            "config/model_config.json",
-            "model_config.json",
-            os.path.expanduser("~/.aiops/model_config.json"),
-            "/etc/aiops/model_config.json"
-        ]
-        
-        for config_path in config_paths:
-            try:
-                if os.path.exists(config_path):
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                        print(f"Loaded model config from: {config_path}")
-                        return config
-            except Exception as e:
-                print(f"Failed to load config from {config_path}: {e}")
-                continue
-        
-        # Fallback to default configuration
-        print("Using default model configuration")
-        return {
-            "default_model": {
-                "provider": "bedrock",
-                "model_id": "apac.amazon.nova-pro-v1:0",
-                "region": "ap-southeast-1",
-                "cross_region_inference_enabled": True
-            },
-            "agent_models": {},
-            "fallback_models": [
-                "apac.amazon.nova-pro-v1:0",
-                "anthropic.claude-3-haiku-20240307-v1:0"
-            ]
-        }
+        return _load_model_config_cached()
     
     def _create_model_from_config(self, config: Dict[str, Any]):
         """Create model instance from configuration"""
@@ -194,13 +245,17 @@ class BaseStrandsAgent(ABC):
         self.update_state(current_task=request[:50] + "..." if len(request) > 50 else request)
         
         try:
-            # Pass system state through invocation_state
-            invocation_state = kwargs.get('invocation_state', {})
-            invocation_state.update({
-                'agent_id': self.agent_id,
-                'system_state': self.system_state,
-                'agent_capabilities': self.capabilities
-            })
+            # Pass system state through invocation_state. Strands mutates that
+            # dict during the call (request_state, trace parent), so each call
+            # gets a fresh copy of the cached base entries
+            if self._base_invocation_state is None:
+                # Built on first use so subclasses can set capabilities in __init__
+                self._base_invocation_state = {
+                    'agent_id': self.agent_id,
+                    'system_state': self.system_state,
+                    'agent_capabilities': self.capabilities
+                }
+            invocation_state = {**(kwargs.pop('invocation_state', None) or {}), **self._base_invocation_state}
             
             response = self.strands_agent(request, invocation_state=invocation_state, **kwargs)
             
@@ -215,7 +270,8 @@ class BaseStrandsAgent(ABC):
         finally:
             self.update_state(current_task=None)
     
-    def update_state(self, current_task: Optional[str] = None, load_level: Optional[float] = None) -> None:
+    def update_state(self, current_task: Optional[str] = None, load_level: Optional[float] = None,
+                     now: Optional[datetime] = None) -> None:
         """Update agent state"""
         agent_state = self.system_state.get_agent_state(self.agent_id)
         if agent_state:
@@ -223,15 +279,15 @@ class BaseStrandsAgent(ABC):
                 agent_state.current_task = current_task
             if load_level is not None:
                 agent_state.load_level = load_level
-            agent_state.last_activity = datetime.now()
+            agent_state.last_activity = now or datetime.now()
     
     def get_investigation_context(self, investigation_id: str) -> Optional[Investigation]:
         """Get investigation context from shared state"""
         return self.system_state.get_investigation(investigation_id)
     
-    def update_investigation_context(self, investigation: Investigation) -> None:
+    def update_investigation_context(self, investigation: Investigation, now: Optional[datetime] = None) -> None:
         """Update investigation context in shared state"""
-        self.system_state.update_investigation(investigation)
+        self.system_state.update_investigation(investigation, now)
     
     def is_agent_available(self, agent_id: str) -> bool:
         """Check if another agent is available"""
@@ -3,46 +3,83 @@
 from strands import Agent
 from strands.models import BedrockModel
 from aiops.tools.gateway_config import AGENT_GATEWAY_CONFIG, get_agent_description
+from aiops.agents.agent_configs import cached_system_prompt
 from aiops.tools.storage_tools import save_investigation_workflow, trigger_investigation, update_confidence
 from aiops.utils.context_store import InvestigationContextStore
-from aiops.utils.online_logger import log
-from typing import Dict
-import json
+from aiops.utils.dynamodb_helper import InvestigationStore
+from aiops.utils.online_logger import log, console
+from aiops.utils.aws_clients import get_sqs_client
+from aiops.utils.concurrency import bedrock_slots
+from aiops.utils import json_utils
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import re
+import threading
+import time
 import uuid
-import boto3
 import os
 
 # Configuration
 MAX_TASKS_PER_INVESTIGATION = int(os.getenv('MAX_TASKS_PER_INVESTIGATION', '5'))
+SQS_BATCH_SIZE = 10  # send_message_batch limit
+# Reuse generated task plans for recurring alarms (same alarm ARN/name and state),
+# skipping the workflow-generation LLM call. Disabled by default because cached
+# task descriptions keep the details of the first occurrence.
+WORKFLOW_PLAN_CACHE_SIZE = int(os.getenv('WORKFLOW_PLAN_CACHE_SIZE', '0'))
 
-class BrainAgent:
-    """Brain Agent processes alarms and generates investigation workflows."""
+_plan_cache: "OrderedDict[Tuple[str, str], Tuple[Dict, List[Dict]]]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+_ALARM_ARN_RE = re.compile(r'^- Alarm Arn:\s+(\S+)', re.MULTILINE)
+_STATE_CHANGE_RE = re.compile(r'^- State Change:\s+\S+\s*->\s*(\S+)', re.MULTILINE)
+
+def _alarm_signature(alarm_text: str) -> Optional[Tuple[str, str]]:
+    """Return (alarm identity, new state) for a CloudWatch alarm, or None if unrecognized.
     
-    def __init__(self):
-        self.model = BedrockModel(model_id="apac.anthropic.claude-sonnet-4-20250514-v1:0")
-        self.context_store = InvestigationContextStore()
-        self.sqs = boto3.client('sqs')
-        self.agent = Agent(
-            model=self.model,
-            tools=[save_investigation_workflow, trigger_investigation],
-            system_prompt=self._get_system_prompt()
-        )
-        self.evaluator_agent = Agent(
-            model=self.model,
-            tools=[update_confidence, save_investigation_workflow, trigger_investigation],
-            system_prompt=self._get_evaluator_prompt()
-        )
+    Handles the SNS JSON payload and the CloudWatch notification email text.
+    """
+    try:
+        alarm = json_utils.loads(alarm_text)
+    except json_utils.JSONDecodeError:
+        alarm = None
+    if isinstance(alarm, dict):
+        identity = alarm.get('AlarmArn') or alarm.get('AlarmName')
+        state = alarm.get('NewStateValue')
+        return (identity, state) if identity and state else None
     
-    def _get_system_prompt(self) -> str:
-        # Dynamically build available agents list with descriptions
-        agents_info = []
-        for agent_name in AGENT_GATEWAY_CONFIG.keys():
-            description = get_agent_description(agent_name)
-            agents_info.append(f"- {agent_name}: {description}")
-        
-        agents_list = "\n".join(agents_info)
-        
-        return f"""You are the Brain Agent for AIOps root cause analysis.
+    arn = _ALARM_ARN_RE.search(alarm_text)
+    state = _STATE_CHANGE_RE.search(alarm_text)
+    if arn and state:
+        return arn.group(1), state.group(1)
+    return None
+
+
+def _get_cached_plan(signature: Tuple[str, str]) -> Optional[Tuple[Dict, List[Dict]]]:
+    with _plan_cache_lock:
+        plan = _plan_cache.get(signature)
+        if plan is not None:
+            _plan_cache.move_to_end(signature)
+        return plan
+
+
+def _cache_plan(signature: Tuple[str, str], alarm_summary: Dict, tasks: List[Dict]) -> None:
+    # Keep only the fields save_workflow needs; status/timestamps are per investigation
+    template = [
+        {key: task[key] for key in ('task_id', 'agent_type', 'description', 'priority')}
+        for task in tasks
+    ]
+    with _plan_cache_lock:
+        _plan_cache[signature] = (dict(alarm_summary), template)
+        _plan_cache.move_to_end(signature)
+        while len(_plan_cache) > WORKFLOW_PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+
+
+# AGENT_GATEWAY_CONFIG is static, so the agent list and both prompts are built once at import
+_AGENTS_LIST = "\n".join(f"- {name}: {get_agent_description(name)}" for name in AGENT_GATEWAY_CONFIG)
+
+_SYSTEM_PROMPT = f"""You are the Brain Agent for AIOps root cause analysis.
 
 Your responsibilities:
 1. Extract alarm information from input text
@@ -53,7 +90,7 @@ Your responsibilities:
 6. Trigger execution using trigger_investigation tool
 
 Available specialized agents:
-{agents_list}
+{_AGENTS_LIST}
 
 When processing alarm text:
 - Extract: alarm name, metric, namespace, threshold, dimensions, state
@@ -85,17 +122,13 @@ Response format for workflow:
 }}
 
 Select appropriate agents based on alarm type and generate actionable investigation tasks."""
-    
-    def _get_evaluator_prompt(self) -> str:
-        """Get system prompt for re-evaluation."""
-        agents_info = []
-        for agent_name in AGENT_GATEWAY_CONFIG.keys():
-            description = get_agent_description(agent_name)
-            agents_info.append(f"- {agent_name}: {description}")
-        
-        agents_list = "\n".join(agents_info)
-        
-        return f"""You are the Brain Agent evaluating investigation progress.
+
+
+_ALARM_INSTRUCTIONS = """Analyze this CloudWatch alarm and generate investigation workflow.
+Generate tasks and save the workflow using save_investigation_workflow tool."""
+
+
+_EVALUATOR_PROMPT = f"""You are the Brain Agent evaluating investigation progress.
 
 Your responsibilities:
 1. Analyze accumulated findings from completed tasks
@@ -104,7 +137,7 @@ Your responsibilities:
 4. Generate additional tasks if needed
 
 Available specialized agents:
-{agents_list}
+{_AGENTS_LIST}
 
 CRITICAL: Evaluation workflow:
 1. FIRST: Call update_confidence with your assessment
@@ -125,6 +158,38 @@ If confidence >= 0.7 (concluding):
 If confidence < 0.7 (continuing):
 - Use save_investigation_workflow to add new tasks
 - Use trigger_investigation to resume execution"""
+
+
+class BrainAgent:
+    """Brain Agent processes alarms and generates investigation workflows."""
+    
+    def __init__(self):
+        self.model = BedrockModel(model_id="apac.anthropic.claude-sonnet-4-20250514-v1:0")
+        self.context_store = InvestigationContextStore()
+        self.sqs = get_sqs_client()
+    
+    def _create_agent(self) -> Agent:
+        """Create a workflow-generation agent with a fresh conversation."""
+        return Agent(
+            model=self.model,
+            tools=[save_investigation_workflow, trigger_investigation],
+            system_prompt=cached_system_prompt(self._get_system_prompt())
+        )
+    
+    def _create_evaluator_agent(self) -> Agent:
+        """Create a re-evaluation agent with a fresh conversation."""
+        return Agent(
+            model=self.model,
+            tools=[update_confidence, save_investigation_workflow, trigger_investigation],
+            system_prompt=cached_system_prompt(self._get_evaluator_prompt())
+        )
+    
+    def _get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
+    
+    def _get_evaluator_prompt(self) -> str:
+        """Get system prompt for re-evaluation."""
+        return _EVALUATOR_PROMPT
     
     def process_alarm_text(self, alarm_text: str, investigation_id: str = None) -> str:
         """Process alarm text and generate investigation workflow.
@@ -141,32 +206,82 @@ If confidence < 0.7 (continuing):
         
         log("brain-init", f"Processing alarm for investigation {investigation_id}", investigation_id=investigation_id)
         
-        prompt = f"""Analyze this CloudWatch alarm and generate investigation workflow.
-
-Investigation ID: {investigation_id}
-Alarm:
-{alarm_text}
-
-Generate tasks and save the workflow using save_investigation_workflow tool."""
+        store = InvestigationStore()
+        
+        signature = _alarm_signature(alarm_text) if WORKFLOW_PLAN_CACHE_SIZE > 0 else None
+        plan = _get_cached_plan(signature) if signature else None
+        if plan is not None:
+            return self._start_cached_plan(store, investigation_id, *plan)
         
-        response = self.agent(prompt)
+        # Static instructions first, per-alarm data last, so consecutive requests
+        # share the longest possible prefix after the cached system prompt
+        prompt = [
+            {"text": _ALARM_INSTRUCTIONS},
+            {"text": f"Investigation ID: {investigation_id}\nAlarm:\n{alarm_text}"}
+        ]
+        
+        response = self._create_agent()(prompt)
         
         # Initialize context (alarm_summary will be extracted from workflow)
         try:
-            from aiops.utils.dynamodb_helper import InvestigationStore
-            store = InvestigationStore()
             workflow = store.get_workflow(investigation_id)
             alarm_summary = workflow.get('alarm_summary', {})
 
             if alarm_summary:
                 self.context_store.create_context(investigation_id, alarm_summary)
                 log("brain-init", f"Context initialized with {len(workflow.get('tasks', []))} tasks", investigation_id=investigation_id)
-                print(f"✅ Context initialized for {investigation_id}")
+                if signature and workflow.get('tasks'):
+                    _cache_plan(signature, alarm_summary, workflow['tasks'])
         except Exception as e:
             log("brain-init", f"Failed to initialize context: {e}", level="ERROR", investigation_id=investigation_id)
-            print(f"⚠️  Failed to initialize context: {e}")
         return investigation_id
     
+    def _start_cached_plan(self, store, investigation_id: str, alarm_summary: Dict, tasks: List[Dict]) -> str:
+        """Save a cached workflow plan under a new investigation and trigger execution."""
+        alarm_summary = {**alarm_summary, 'time': str(int(time.time()))}
+        store.save_workflow(investigation_id, alarm_summary, tasks)
+        self.context_store.create_context(investigation_id, alarm_summary)
+        log("brain-init", f"Reused cached workflow plan with {len(tasks)} tasks", investigation_id=investigation_id)
+        self.send_execution_messages([investigation_id])
+        return investigation_id
+    
+    async def process_alarm_text_async(self, alarm_text: str, investigation_id: str = None) -> str:
+        """Run process_alarm_text in a worker thread so the event loop stays free.
+        
+        Each call builds its own Strands Agent, so concurrent calls are safe.
+        """
+        async with bedrock_slots:
+            return await asyncio.to_thread(self.process_alarm_text, alarm_text, investigation_id)
+    
+    async def process_alarms_async(self, alarm_texts: List[str]) -> List[Optional[str]]:
+        """Process a burst of alarms concurrently.
+        
+        In-flight Bedrock calls are bounded by BEDROCK_MAX_CONCURRENCY.
+        
+        Args:
+            alarm_texts: Raw alarm texts
+            
+        Returns:
+            Investigation IDs in input order, None for alarms that failed
+        """
+        results = await asyncio.gather(
+            *(self.process_alarm_text_async(alarm_text) for alarm_text in alarm_texts),
+            return_exceptions=True
+        )
+        investigation_ids = []
+        for result in results:
+            if isinstance(result, BaseException):
+                log("brain-init", f"Failed to process alarm: {result}", level="ERROR")
+                investigation_ids.append(None)
+            else:
+                investigation_ids.append(result)
+        return investigation_ids
+    
+    async def re_evaluate_workflow_async(self, investigation_id: str) -> str:
+        """Run re_evaluate_workflow in a worker thread so the event loop stays free."""
+        async with bedrock_slots:
+            return await asyncio.to_thread(self.re_evaluate_workflow, investigation_id)
+    
     def re_evaluate_workflow(self, investigation_id: str) -> str:
         """Re-evaluate workflow based on current context and findings.
 
@@ -185,13 +300,10 @@ Generate tasks and save the workflow using save_investigation_workflow tool."""
             return f"Error: No context found for {investigation_id}"
         
         # Get current workflow
-        from aiops.utils.dynamodb_helper import InvestigationStore
         store = InvestigationStore()
         workflow = store.get_workflow(investigation_id)
         
-        total_tasks = len(workflow.get('tasks', []))
-        completed = len([t for t in workflow.get('tasks', []) if t.get('status') == 'COMPLETED'])
-        pending = len([t for t in workflow.get('tasks', []) if t.get('status') == 'PENDING'])
+        total_tasks, completed, pending = self._count_tasks(workflow.get('tasks', ()))
         
         log("brain-evaluate", f"Total: {total_tasks}/{MAX_TASKS_PER_INVESTIGATION}, Completed: {completed}, Pending: {pending}, Confidence: {context.get('confidence', 0)}", investigation_id=investigation_id)
 
@@ -213,8 +325,8 @@ Current Context:
 - Status: {context.get('status')}
 - Confidence: {context.get('confidence')}
 - Hypothesis: {context.get('current_hypothesis')}
-- Findings: {json.dumps(context.get('findings', {}), indent=2)}
-- Timeline: {json.dumps(context.get('timeline', []), indent=2)}
+- Findings: {json_utils.dumps(context.get('findings', {}), indent=True)}
+- Timeline: {json_utils.dumps(context.get('timeline', []), indent=True)}
 
 Current Workflow:
 - Completed Tasks: {completed}
@@ -222,19 +334,63 @@ Current Workflow:
 
 Evaluate the findings and decide next steps."""
         
-        response = self.evaluator_agent(prompt)
+        response = self._create_evaluator_agent()(prompt)
         log("brain-evaluate", "Evaluation complete", investigation_id=investigation_id)
         
         # Send SQS message to continue execution
+        if self.send_execution_messages([investigation_id]):
+            console("✅ Re-evaluation complete, execution triggered")
+        
+        return f"Re-evaluation complete for {investigation_id}"
+    
+    @staticmethod
+    def _count_tasks(tasks) -> Tuple[int, int, int]:
+        """Count tasks by status in one traversal.
+        
+        Returns:
+            (total_count, completed_count, pending_count)
+        """
+        total = completed = pending = 0
+        for task in tasks:
+            total += 1
+            status = task.get('status')
+            if status == 'COMPLETED':
+                completed += 1
+            elif status == 'PENDING':
+                pending += 1
+        return total, completed, pending
+    
+    def send_execution_messages(self, investigation_ids: List[str]) -> int:
+        """Queue EXECUTION messages, up to 10 per SQS send_message_batch call.
+        
+        Args:
+            investigation_ids: Investigation IDs to resume
+            
+        Returns:
+            Number of messages accepted by SQS
+        """
         queue_url = os.getenv('INVESTIGATION_QUEUE_URL')
-        if queue_url:
-            self.sqs.send_message(
+        if not queue_url:
+            return 0
+        
+        sent = 0
+        for start in range(0, len(investigation_ids), SQS_BATCH_SIZE):
+            batch = investigation_ids[start:start + SQS_BATCH_SIZE]
+            response = self.sqs.send_message_batch(
                 QueueUrl=queue_url,
-                MessageBody=json.dumps({
-                    'message_type': 'EXECUTION',
-                    'investigation_id': investigation_id
-                })
+                Entries=[
+                    {
+                        'Id': str(i),
+                        'MessageBody': json_utils.dumps({
+                            'message_type': 'EXECUTION',
+                            'investigation_id': investigation_id
+                        })
+                    }
+                    for i, investigation_id in enumerate(batch)
+                ]
             )
-            print(f"✅ Re-evaluation complete, execution triggered")
-        
-        return f"Re-evaluation complete for {investigation_id}"
+            sent += len(response.get('Successful', []))
+            for failure in response.get('Failed', []):
+                failed_id = batch[int(failure['Id'])]
+                log("brain-evaluate", f"Failed to queue execution: {failure.get('Message')}", level="ERROR", investigation_id=failed_id)
+        return sent
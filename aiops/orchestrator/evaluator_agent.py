@@ -1,15 +1,22 @@
 """Evaluator Agent for post-investigation validation."""
 
+import asyncio
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from strands import Agent
 from strands.models import BedrockModel
 from aiops.utils.context_store import InvestigationContextStore
 from aiops.utils.dynamodb_helper import InvestigationStore
 from aiops.utils.online_logger import log
-from aiops.tools.mcp_client import create_gateway_mcp_client
+from aiops.utils import json_utils
+from aiops.utils.concurrency import bedrock_slots
+from aiops.tools.mcp_pool import mcp_pool
 from aiops.tools.gateway_config import get_gateway_url
 
+# Fetches the context alongside the workflow read
+_fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="evaluator-fetch")
+
+
 class EvaluatorAgent:
     """Evaluator Agent validates investigation results and alerts if needed."""
     
@@ -28,12 +35,12 @@ class EvaluatorAgent:
             Evaluation result
         """
         log("evaluator-start", f"Evaluating investigation {investigation_id}", investigation_id=investigation_id)
-        print(f"🔍 Evaluating investigation: {investigation_id}")
         
         try:
-            # Get investigation context and workflow
-            context = self.context_store.get_context(investigation_id)
+            # Get investigation context and workflow; the two reads are independent
+            context_future = _fetch_pool.submit(self.context_store.get_context, investigation_id)
             workflow = self.store.get_workflow(investigation_id)
+            context = context_future.result()
             
             if not context or not workflow:
                 log("evaluator-error", "Context or workflow not found", level="ERROR", investigation_id=investigation_id)
@@ -45,10 +52,8 @@ class EvaluatorAgent:
                 log("evaluator-error", "Notification gateway not configured", level="ERROR", investigation_id=investigation_id)
                 return {"status": "error", "error": "Notification gateway not configured"}
             
-            mcp_client = create_gateway_mcp_client(gateway_url)
-            
-            with mcp_client:
-                tools = mcp_client.list_tools_sync()
+            with mcp_pool.acquire(gateway_url) as mcp_session:
+                tools = mcp_session.tools()
                 
                 # Build evaluation prompt
                 prompt = f"""Evaluate this completed investigation for quality and completeness.
@@ -56,17 +61,17 @@ class EvaluatorAgent:
 Investigation ID: {investigation_id}
 
 Alarm Summary:
-{json.dumps(workflow.get('alarm_summary', {}), indent=2)}
+{json_utils.dumps(workflow.get('alarm_summary', {}))}
 
 Investigation Status: {context.get('status')}
 Confidence: {context.get('confidence')}
 Hypothesis: {context.get('current_hypothesis')}
 
 Findings:
-{json.dumps(context.get('findings', {}), indent=2)}
+{json_utils.dumps(context.get('findings', {}))}
 
 Timeline:
-{json.dumps(context.get('timeline', []), indent=2)}
+{json_utils.dumps(context.get('timeline', []))}
 
 Your task:
 1. Evaluate if the root cause analysis is complete and convincing
@@ -90,7 +95,6 @@ Be critical but fair. Only send alerts for significant concerns that require hum
                 response = agent(prompt)
                 
                 log("evaluator-complete", f"Evaluation completed for {investigation_id}", investigation_id=investigation_id)
-                print(f"✅ Evaluation completed")
                 
                 return {
                     "status": "completed",
@@ -100,9 +104,13 @@ Be critical but fair. Only send alerts for significant concerns that require hum
             
         except Exception as e:
             log("evaluator-error", f"Error evaluating investigation: {e}", level="ERROR", investigation_id=investigation_id)
-            print(f"❌ Error evaluating investigation: {e}")
             return {
                 "status": "error",
                 "investigation_id": investigation_id,
                 "error": str(e)
             }
+    
+    async def evaluate_investigation_async(self, investigation_id: str) -> dict:
+        """evaluate_investigation on a worker thread, bounded by BEDROCK_MAX_CONCURRENCY."""
+        async with bedrock_slots:
+            return await asyncio.to_thread(self.evaluate_investigation, investigation_id)
@@ -1,19 +1,72 @@
 """Executor Agent for sequential task execution."""
 
+import asyncio
 import os
-import boto3
 import json
 import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 from botocore.config import Config
 from strands import Agent
 from strands.models import BedrockModel
 from aiops.tools.storage_tools import get_alarm_summary, store_task_findings, get_investigation_summary
 from aiops.utils.dynamodb_helper import InvestigationStore
 from aiops.utils.context_store import InvestigationContextStore
-from aiops.utils.online_logger import log
+from aiops.utils.online_logger import log, console
+from aiops.utils import json_utils
+from aiops.utils.aws_clients import get_sqs_client
+from aiops.utils.concurrency import bedrock_slots
 from aiops.tools import load_tools_for_agent
-from aiops.agents.agent_configs import get_system_prompt, process_agent_result
+from aiops.tools.mcp_pool import mcp_pool
+from aiops.tools.gateway_config import get_gateways_for_agent, get_gateway_url
+from aiops.agents.agent_configs import cached_system_prompt, get_system_prompt_parts, process_agent_result
+
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_json_decoder = json.JSONDecoder()
+
+
+def _extract_json(message: str) -> Optional[dict]:
+    """Extract the JSON object from an agent response.
+    
+    The system prompt asks for JSON only, so parse the whole message first.
+    Otherwise decode the first object starting at the first '{' (ignoring any
+    trailing text), and finally fall back to the first-'{'-to-last-'}' span.
+    """
+    stripped = message.strip()
+    if stripped.startswith('{'):
+        try:
+            parsed = json_utils.loads(stripped)
+            if isinstance(parsed, dict):
+                return parsed
+        except json_utils.JSONDecodeError:
+            pass
+    
+    start = message.find('{')
+    if start == -1:
+        return None
+    try:
+        parsed = _json_decoder.raw_decode(message, start)[0]
+        if isinstance(parsed, dict):
+            return parsed
+    except json.JSONDecodeError:
+        pass
+    
+    match = _JSON_OBJECT_RE.search(message, start)
+    if match is None:
+        return None
+    try:
+        parsed = json_utils.loads(match.group())
+        return parsed if isinstance(parsed, dict) else None
+    except json_utils.JSONDecodeError:
+        return None
+
+
+# Overlaps per-task DynamoDB reads with MCP gateway setup, and the
+# independent completion writes with each other
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="executor-prefetch")
+
 
 class ExecutorAgent:
     """Executor Agent executes investigation tasks sequentially."""
@@ -21,7 +74,7 @@ class ExecutorAgent:
     def __init__(self):
         self.store = InvestigationStore()
         self.context_store = InvestigationContextStore()
-        self.sqs = boto3.client('sqs')
+        self.sqs = get_sqs_client()
         
         # Use smaller max_tokens to reduce streaming time
         self.model = BedrockModel(
@@ -38,7 +91,6 @@ class ExecutorAgent:
             Execution summary
         """
         log("executor-start", f"Starting workflow execution: {investigation_id}", investigation_id=investigation_id)
-        print(f"🚀 Starting workflow execution: {investigation_id}")
         
         try:
             # Get next task from DynamoDB
@@ -47,13 +99,10 @@ class ExecutorAgent:
             if not task:
                 log("executor-complete", "No pending tasks - completing investigation", investigation_id=investigation_id)
                 self.context_store.update_status(investigation_id, "COMPLETED")
-                print("✅ Investigation completed - no pending tasks")
                 return {"status": "completed", "investigation_id": investigation_id}
             
             log("executor-execute", f"Executing task {task['task_id']} with {task['agent_type']}", investigation_id=investigation_id)
-            print(f"📋 Executing task: {task['task_id']}")
-            print(f"   Agent: {task['agent_type']}")
-            print(f"   Description: {task['description']}")
+            console(f"📋 Task description: {task['description']}")
             
             # Execute task with tools and context
             result = self.execute_task(task, investigation_id)
@@ -61,20 +110,21 @@ class ExecutorAgent:
             log("executor-execute", f"Task {task['task_id']} executed", investigation_id=investigation_id)
             
             # Findings are already stored via store_task_findings tool
-            # Just add timeline event
+            # Just add timeline event, alongside marking the task complete
+            # (separate tables, so the two writes can overlap)
             agent_type = task['agent_type']
             task_id = task['task_id']
-            self.context_store.add_timeline_event(
+            timeline_future = _prefetch_pool.submit(
+                self.context_store.add_timeline_event,
                 investigation_id,
                 f"Task {task_id} completed by {agent_type}",
                 agent_type
             )
-            print(f"✅ Task {task_id} completed")
             
             # Mark complete in DynamoDB
             self.store.complete_task(investigation_id, task['task_id'], result)
+            timeline_future.result()
             log("executor-complete", f"Task {task['task_id']} completed", investigation_id=investigation_id)
-            print(f"✅ Task {task['task_id']} completed")
             
             # RootCauseAnalysisAgent completes investigation - no re-evaluation needed
             if agent_type == "RootCauseAnalysisAgent":
@@ -90,15 +140,16 @@ class ExecutorAgent:
             # Send SQS message to Brain Agent for re-evaluation
             queue_url = os.getenv('INVESTIGATION_QUEUE_URL')
             if queue_url:
+                # Sent synchronously: a lost RE_EVALUATE stalls the investigation,
+                # so a send failure must surface as an error result
                 self.sqs.send_message(
                     QueueUrl=queue_url,
-                    MessageBody=json.dumps({
+                    MessageBody=json_utils.dumps({
                         'message_type': 'RE_EVALUATE',
                         'investigation_id': investigation_id
                     })
                 )
                 log("executor-complete", "Re-evaluation message sent to Brain Agent", investigation_id=investigation_id)
-                print(f"✅ Re-evaluation message sent to Brain Agent")
             
             return {
                 "status": "completed",
@@ -108,13 +159,27 @@ class ExecutorAgent:
             }
         except Exception as e:
             log("executor-error", f"Error executing workflow: {e}", level="ERROR", investigation_id=investigation_id)
-            print(f"❌ Error executing workflow: {e}")
             return {
                 "status": "error",
                 "investigation_id": investigation_id,
                 "error": str(e)
             }
     
+    async def execute_workflow_async(self, investigation_id: str) -> dict:
+        """execute_workflow on a worker thread, bounded by BEDROCK_MAX_CONCURRENCY."""
+        async with bedrock_slots:
+            return await asyncio.to_thread(self.execute_workflow, investigation_id)
+    
+    def _build_task_context(self, agent_type: str, description: str, investigation_id: str) -> tuple:
+        """Build (system_prompt, user context) for a task.
+        
+        Time and investigation ID go in the user message so the system prompt
+        stays identical across tasks.
+        """
+        system_prompt, prompt_context = get_system_prompt_parts(agent_type, investigation_id)
+        alarm_summary = self.store.get_workflow(investigation_id).get('alarm_summary', {})
+        return system_prompt, f"{prompt_context}\n\nAlarm Context: {alarm_summary}\n\nTask: {description}"
+    
     def execute_task(self, task: dict, investigation_id: str) -> dict:
         """Execute a single task using appropriate agent with tools.
         
@@ -129,13 +194,6 @@ class ExecutorAgent:
         description = task['description']
         
         try:
-            from aiops.tools.mcp_client import create_gateway_mcp_client
-            from aiops.tools.gateway_config import get_gateways_for_agent, get_gateway_url
-            
-            # Load alarm summary for context
-            alarm_summary = self.store.get_workflow(investigation_id).get('alarm_summary', {})
-            context = f"Alarm Context: {alarm_summary}\n\nTask: {description}"
-            
             # Get gateway for this agent
             gateway_names = get_gateways_for_agent(agent_type)
             if not gateway_names:
@@ -144,36 +202,33 @@ class ExecutorAgent:
             gateway_name = gateway_names[0]
             gateway_url = get_gateway_url(gateway_name)
             
-            print(f"🔧 Connecting to gateway: {gateway_name}")
-            mcp_client = create_gateway_mcp_client(gateway_url)
+            # Read the alarm context from DynamoDB while the gateway session is set up
+            context_future = _prefetch_pool.submit(self._build_task_context, agent_type, description, investigation_id)
+            
+            console(f"🔧 Connecting to gateway: {gateway_name}")
             
-            # Keep MCP client session open during execution
-            with mcp_client:
+            # Hold a pooled MCP session for the whole execution; the tools are bound to it
+            with mcp_pool.acquire(gateway_url) as mcp_session:
                 # Load tools within context
                 tools = [get_alarm_summary, store_task_findings, get_investigation_summary]
-                pagination_token = None
-                while True:
-                    result = mcp_client.list_tools_sync(pagination_token=pagination_token)
-                    tools.extend(result)
-                    if result.pagination_token is None:
-                        break
-                    pagination_token = result.pagination_token
+                tools.extend(mcp_session.tools())
                 
-                print(f"✅ Loaded {len(tools)} tools")
+                console(f"✅ Loaded {len(tools)} tools")
                 
                 # Create and execute agent within context
-                print(f"🤖 Creating agent...")
-                system_prompt = get_system_prompt(agent_type, investigation_id)
+                console("🤖 Creating agent...")
+                system_prompt, context = context_future.result()
                 system_prompt += "\n\nIMPORTANT: Return ONLY valid JSON in the specified format. No additional text before or after the JSON."
                 agent = Agent(
                     model=self.model,
                     tools=tools,
-                    system_prompt=system_prompt
+                    # Static per agent type, so marked as a Bedrock cache point
+                    system_prompt=cached_system_prompt(system_prompt)
                 )
                 
-                print(f"▶️  Executing agent with context...")
+                console("▶️  Executing agent with context...")
                 response = agent(context)
-                print(f"✅ Agent execution completed")
+                console("✅ Agent execution completed")
                 
                 # Extract message from response
                 if hasattr(response, 'message'):
@@ -189,18 +244,13 @@ class ExecutorAgent:
                     }
                 
                 # Try to extract JSON from string message
-                import re
-                json_match = re.search(r'\{.*\}', message, re.DOTALL)
-                if json_match:
-                    try:
-                        parsed_result = json.loads(json_match.group())
-                        return {
-                            "status": "completed",
-                            "message": message,
-                            **parsed_result
-                        }
-                    except json.JSONDecodeError:
-                        pass
+                parsed_result = _extract_json(message)
+                if parsed_result is not None:
+                    return {
+                        "status": "completed",
+                        "message": message,
+                        **parsed_result
+                    }
                 
                 return {
                     "status": "completed",
@@ -208,9 +258,8 @@ class ExecutorAgent:
                 }
                 
         except Exception as e:
-            import traceback
-            print(f"❌ Error executing task: {e}")
-            print(f"📍 Traceback: {traceback.format_exc()[-500:]}")
+            log("executor-error", f"Error executing task {task.get('task_id')}: {e}", level="ERROR", investigation_id=investigation_id)
+            console(f"📍 Traceback: {traceback.format_exc()[-500:]}")
             return {
                 "status": "error",
                 "error": str(e)
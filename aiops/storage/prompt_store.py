@@ -1,13 +1,36 @@
 """Agent prompt storage in DynamoDB."""
-import boto3
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timezone
+
+from cachetools import TTLCache
+
+from ..utils.aws_clients import get_dynamodb_resource, get_table
+
+BATCH_GET_LIMIT = 100  # BatchGetItem keys per request
+BATCH_GET_MAX_RETRIES = 5  # retries of throttled (unprocessed) keys
+PROMPT_CACHE_SIZE = 512
+PROMPT_CACHE_TTL = 60  # seconds
+
+def format_version(number: int) -> str:
+    """Format a prompt version number as a sortable version string, e.g. 'v000012'."""
+    return f"v{number:06d}"
 
 
 class PromptStore:
+    # Shared by all instances and keyed by table name. Cached items are shared
+    # between callers and must be treated as read-only.
+    _cache = TTLCache(maxsize=PROMPT_CACHE_SIZE, ttl=PROMPT_CACHE_TTL)
+    _cache_lock = threading.Lock()
+    
     def __init__(self, table_name: str = 'aiops-agent-prompts'):
-        self.dynamodb = boto3.resource('dynamodb')
-        self.table = self.dynamodb.Table(table_name)
+        self.table_name = table_name
+    
+    @property
+    def table(self):
+        """DynamoDB Table handle (shared per thread)"""
+        return get_table(self.table_name)
     
     def save_prompt(
         self,
@@ -22,21 +45,119 @@ class PromptStore:
             'version': version,
             'prompts': prompts,
             'variables': variables or {},
-            'updated_at': datetime.utcnow().isoformat()
+            'updated_at': datetime.now(timezone.utc).isoformat(timespec='milliseconds')
         }
         self.table.put_item(Item=item)
+        with self._cache_lock:
+            self._cache.pop((self.table_name, agent_name, version), None)
+            self._cache.pop((self.table_name, agent_name), None)
+            self._cache.pop(('latest', self.table_name, agent_name), None)
     
     def get_prompt(self, agent_name: str, version: str) -> Optional[Dict[str, Any]]:
         """Retrieve specific prompt version."""
-        response = self.table.get_item(
-            Key={'agent_name': agent_name, 'version': version}
+        return self.get_prompts([(agent_name, version)]).get((agent_name, version))
+    
+    def get_prompts(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Retrieve several prompt versions with BatchGetItem (GetItem for one key).
+        
+        Args:
+            pairs: (agent_name, version) keys; duplicates are fetched once
+            
+        Returns:
+            Items keyed by (agent_name, version); missing prompts are omitted
+            
+        Raises:
+            RuntimeError: If throttled keys remain unprocessed after retries
+        """
+        found = {}
+        keys = []
+        with self._cache_lock:
+            for pair in dict.fromkeys(pairs):
+                item = self._cache.get((self.table_name, *pair))
+                if item is None:
+                    keys.append(pair)
+                else:
+                    found[pair] = item
+        if not keys:
+            return found
+        
+        fetched = {}
+        if len(keys) == 1:
+            # A single key is a plain GetItem; no batch round-trip or retry loop
+            agent_name, version = keys[0]
+            item = self.table.get_item(Key={'agent_name': agent_name, 'version': version}).get('Item')
+            if item is not None:
+                fetched[keys[0]] = item
+        else:
+            dynamodb = get_dynamodb_resource()
+            for start in range(0, len(keys), BATCH_GET_LIMIT):
+                request = {self.table_name: {'Keys': [
+                    {'agent_name': agent_name, 'version': version}
+                    for agent_name, version in keys[start:start + BATCH_GET_LIMIT]
+                ]}}
+                attempt = 0
+                while request:
+                    response = dynamodb.batch_get_item(RequestItems=request)
+                    for item in response.get('Responses', {}).get(self.table_name, []):
+                        fetched[(item['agent_name'], item['version'])] = item
+                    request = response.get('UnprocessedKeys')
+                    if request:
+                        if attempt >= BATCH_GET_MAX_RETRIES:
+                            unprocessed = len(request[self.table_name]['Keys'])
+                            raise RuntimeError(
+                                f"BatchGetItem left {unprocessed} prompt keys unprocessed after {attempt} retries"
+                            )
+                        # Throttled keys: back off before retrying them
+                        time.sleep(min(0.05 * 2 ** attempt, 1.0))
+                        attempt += 1
+        
+        with self._cache_lock:
+            for (agent_name, version), item in fetched.items():
+                self._cache[(self.table_name, agent_name, version)] = item
+        found.update(fetched)
+        return found
+    
+    def get_latest_prompt(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Retrieve the prompt with the highest version sort key.
+        
+        DynamoDB orders the version sort key byte-wise, so this is the newest
+        prompt only if versions sort lexically in release order, e.g. the
+        zero-padded strings from format_version(); "v9" sorts after "v10".
+        Reads a single item regardless of how many versions exist.
+        """
+        key = ('latest', self.table_name, agent_name)
+        with self._cache_lock:
+            item = self._cache.get(key)
+        if item is not None:
+            return item
+        response = self.table.query(
+            KeyConditionExpression='agent_name = :name',
+            ExpressionAttributeValues={':name': agent_name},
+            ScanIndexForward=False,
+            Limit=1
         )
-        return response.get('Item')
+        items = response.get('Items', [])
+        if not items:
+            return None
+        with self._cache_lock:
+            self._cache[key] = items[0]
+        return items[0]
     
     def list_versions(self, agent_name: str) -> List[Dict[str, Any]]:
-        """List all versions for an agent."""
+        """List all versions for an agent.
+        
+        Reads every version item; use get_latest_prompt when only the newest is needed.
+        """
+        key = (self.table_name, agent_name)
+        with self._cache_lock:
+            items = self._cache.get(key)
+        if items is not None:
+            return items
         response = self.table.query(
             KeyConditionExpression='agent_name = :name',
             ExpressionAttributeValues={':name': agent_name}
         )
-        return response.get('Items', [])
+        items = response.get('Items', [])
+        with self._cache_lock:
+            self._cache[key] = items
+        return items
@@ -1,13 +1,13 @@
 """Simplified data store for AIOps using DynamoDB"""
 
-import json
-import boto3
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError
 
 from ..models.data_models import Investigation
 from ..models.enums import InvestigationStatus
+from ..utils import json_utils
+from ..utils.aws_clients import get_table
 
 
 class SimpleInvestigationStore:
@@ -15,8 +15,11 @@ class SimpleInvestigationStore:
     
     def __init__(self, table_name: str = "aiops-investigations"):
         self.table_name = table_name
-        self.dynamodb = boto3.resource('dynamodb')
-        self.table = self.dynamodb.Table(table_name)
+    
+    @property
+    def table(self):
+        """DynamoDB Table handle (shared per thread)"""
+        return get_table(self.table_name)
     
     def save_investigation(self, investigation: Investigation) -> bool:
         """Save investigation to DynamoDB"""
@@ -148,13 +151,13 @@ class SimpleInvestigationStore:
             'updated_at': investigation.updated_at.isoformat()
         }
         
-        return json.dumps(data)
+        return json_utils.dumps(data)
     
     def _deserialize_investigation(self, data_str: str) -> Investigation:
         """Deserialize investigation from JSON string"""
         from ..models.data_models import AlarmInput, Investigation
         
-        data = json.loads(data_str)
+        data = json_utils.loads(data_str)
         
         # Reconstruct alarm input
         alarm_input = AlarmInput(
@@ -7,7 +7,8 @@ from .gateway_config import (
     get_agent_description,
     get_gateway_url
 )
-from .tool_loader import load_tools_for_agent
+from .tool_loader import list_all_tools, load_tools_for_agent
+from .mcp_pool import MCPClientPool, mcp_pool
 
 __all__ = [
     "create_gateway_mcp_client",
@@ -15,5 +16,8 @@ __all__ = [
     "get_gateways_for_agent",
     "get_agent_description",
     "get_gateway_url",
-    "load_tools_for_agent"
+    "list_all_tools",
+    "load_tools_for_agent",
+    "MCPClientPool",
+    "mcp_pool"
 ]
@@ -0,0 +1,149 @@
+"""Pool of started MCP gateway sessions, reused across tasks."""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from aiops.utils.online_logger import log
+
+from .mcp_client import create_gateway_mcp_client
+from .tool_loader import list_all_tools
+
+MAX_SESSIONS_PER_GATEWAY = 8
+IDLE_TIMEOUT = 60.0  # seconds an unused session is kept open
+# Sessions sign requests with the credentials captured at creation, so retire
+# them well before temporary credentials expire
+MAX_SESSION_AGE = 300.0
+TOOLS_TTL = 60.0  # seconds a session's tool listing is reused
+
+
+class PooledSession:
+    """A started MCP client plus its cached tool listing."""
+    __slots__ = ("client", "created_at", "last_used", "_tools", "_tools_at")
+
+    def __init__(self, client):
+        self.client = client
+        self.created_at = self.last_used = time.monotonic()
+        self._tools = None
+        self._tools_at = 0.0
+
+    def tools(self) -> List:
+        """List the gateway's tools, reusing this session's last listing within TOOLS_TTL."""
+        now = time.monotonic()
+        if self._tools is None or now - self._tools_at > TOOLS_TTL:
+            self._tools = list_all_tools(self.client)
+            self._tools_at = now
+        return list(self._tools)
+
+    def close(self) -> None:
+        try:
+            self.client.__exit__(None, None, None)
+        except Exception as e:
+            log("mcp-pool", f"Failed to close MCP session: {e}", level="WARNING")
+
+
+class MCPClientPool:
+    """Keeps MCP sessions open per gateway URL instead of reconnecting per task.
+
+    A session is used by one caller at a time. Sessions whose block raised are
+    closed rather than returned, and idle or old sessions are retired.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS_PER_GATEWAY,
+                 idle_timeout: float = IDLE_TIMEOUT, max_age: float = MAX_SESSION_AGE):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        # Keyed by (gateway_url, region): sessions are signed for their region
+        self._idle: Dict[Tuple[str, Optional[str]], List[PooledSession]] = {}
+        self._open: Dict[Tuple[str, Optional[str]], int] = {}
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def acquire(self, gateway_url: str, region: Optional[str] = None) -> Iterator[PooledSession]:
+        """Check out a started session for gateway_url, blocking while the gateway is at capacity."""
+        key = (gateway_url, region)
+        session = self._checkout(key)
+        try:
+            yield session
+        except BaseException:
+            self._release(key, session, reuse=False)
+            raise
+        self._release(key, session, reuse=True)
+
+    def close(self) -> None:
+        """Close all idle sessions."""
+        with self._cond:
+            stale = [s for sessions in self._idle.values() for s in sessions]
+            for key, sessions in self._idle.items():
+                self._open[key] -= len(sessions)
+            self._idle.clear()
+            self._cond.notify_all()
+        for session in stale:
+            session.close()
+
+    def _expired(self, session: PooledSession, now: float) -> bool:
+        return now - session.last_used > self.idle_timeout or now - session.created_at > self.max_age
+
+    def _evict_locked(self, now: float) -> List[PooledSession]:
+        stale = []
+        for key, sessions in self._idle.items():
+            keep = [s for s in sessions if not self._expired(s, now)]
+            if len(keep) != len(sessions):
+                stale.extend(s for s in sessions if self._expired(s, now))
+                self._open[key] -= len(sessions) - len(keep)
+                self._idle[key] = keep
+        if stale:
+            self._cond.notify_all()
+        return stale
+
+    def _checkout(self, key: Tuple[str, Optional[str]]) -> PooledSession:
+        with self._cond:
+            stale = self._evict_locked(time.monotonic())
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    session = idle.pop()
+                    break
+                if self._open.get(key, 0) < self.max_sessions:
+                    self._open[key] = self._open.get(key, 0) + 1
+                    session = None
+                    break
+                self._cond.wait()
+        for old in stale:
+            old.close()
+        if session is not None:
+            return session
+
+        # Connect outside the lock; give the slot back if that fails
+        try:
+            client = create_gateway_mcp_client(*key)
+            client.__enter__()
+        except BaseException:
+            with self._cond:
+                self._open[key] -= 1
+                self._cond.notify()
+            raise
+        return PooledSession(client)
+
+    def _release(self, key: Tuple[str, Optional[str]], session: PooledSession, reuse: bool) -> None:
+        now = time.monotonic()
+        session.last_used = now
+        with self._cond:
+            if reuse and not self._expired(session, now):
+                self._idle.setdefault(key, []).append(session)
+                session = None
+            else:
+                self._open[key] -= 1
+            stale = self._evict_locked(now)
+            self._cond.notify()
+        if session is not None:
+            session.close()
+        for old in stale:
+            old.close()
+
+
+mcp_pool = MCPClientPool()
+atexit.register(mcp_pool.close)
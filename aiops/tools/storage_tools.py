@@ -1,18 +1,49 @@
 """Storage tools for agents to save investigation data."""
 
-import boto3
-import json
 import os
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from strands.tools import tool
 from aiops.utils.dynamodb_helper import InvestigationStore
 from aiops.utils.context_store import InvestigationContextStore
+from aiops.utils import json_utils
+from aiops.utils.aws_clients import get_sqs_client
 from aiops.models.enums import MessageType
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
 store = InvestigationStore()
 context_store = InvestigationContextStore()
-sqs = boto3.client('sqs')
+sqs = get_sqs_client()
+
+# In-flight tool calls keyed by (tool name, args); see _coalesce
+_inflight: Dict[Tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _coalesce(key: Tuple, fn: Callable[[], str]) -> str:
+    """Run fn once for concurrent callers with the same key.
+    
+    Callers that arrive while the first call is running wait for and share its
+    result instead of repeating the side effect (e.g. a duplicate SQS message).
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        result = fn()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
 
 @tool
 def update_confidence(
@@ -75,14 +106,17 @@ def trigger_investigation(investigation_id: str) -> str:
     if not queue_url:
         return "Error: INVESTIGATION_QUEUE_URL not configured"
     
-    sqs.send_message(
-        QueueUrl=queue_url,
-        MessageBody=json.dumps({
-            'message_type': MessageType.EXECUTION.value,
-            'investigation_id': investigation_id
-        })
-    )
-    return f"Investigation {investigation_id} triggered for execution"
+    def send() -> str:
+        sqs.send_message(
+            QueueUrl=queue_url,
+            MessageBody=json_utils.dumps({
+                'message_type': MessageType.EXECUTION.value,
+                'investigation_id': investigation_id
+            })
+        )
+        return f"Investigation {investigation_id} triggered for execution"
+    
+    return _coalesce(('trigger_investigation', investigation_id), send)
 
 @tool
 def store_task_findings(
@@ -1,42 +1,67 @@
 """Tool loader for loading MCP tools from gateways."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from .mcp_client import create_gateway_mcp_client
 from .gateway_config import get_gateways_for_agent, get_gateway_url
 
+# Gateways are listed concurrently; threads start only when first needed
+_gateway_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mcp-tools")
+
+
+def list_all_tools(mcp_client) -> List:
+    """List every tool from an open MCP client.
+
+    Pages are chained by opaque pagination tokens, so within one gateway they
+    have to be requested in order.
+
+    Args:
+        mcp_client: MCP client with an active session
+
+    Returns:
+        List of tools across all pages
+    """
+    tools = []
+    pagination_token = None
+
+    while True:
+        result = mcp_client.list_tools_sync(pagination_token=pagination_token)
+        tools.extend(result)
+
+        if result.pagination_token is None:
+            break
+        pagination_token = result.pagination_token
+
+    return tools
+
+
 def load_tools_for_agent(agent_name: str, region: str = None) -> List:
     """Load all tools for an agent from configured gateways.
-    
+
     Args:
         agent_name: Name of the agent (e.g., "LogsAgent")
         region: AWS region (defaults to session region)
-        
+
     Returns:
         List of tools from all configured gateways
     """
-    tools = []
-    gateway_names = get_gateways_for_agent(agent_name)
-    
-    for gateway_name in gateway_names:
+    gateway_urls = []
+    for gateway_name in get_gateways_for_agent(agent_name):
         gateway_url = get_gateway_url(gateway_name)
         if not gateway_url:
             raise ValueError(f"Gateway URL not configured for {gateway_name}")
-        
+        gateway_urls.append(gateway_url)
+
+    def load(gateway_url: str) -> List:
         mcp_client = create_gateway_mcp_client(gateway_url, region)
-        
         with mcp_client:
-            # List all tools from gateway
-            gateway_tools = []
-            pagination_token = None
-            
-            while True:
-                result = mcp_client.list_tools_sync(pagination_token=pagination_token)
-                gateway_tools.extend(result)
-                
-                if result.pagination_token is None:
-                    break
-                pagination_token = result.pagination_token
-            
-            tools.extend(gateway_tools)
-    
+            return list_all_tools(mcp_client)
+
+    if len(gateway_urls) == 1:
+        return load(gateway_urls[0])
+
+    # Each gateway is an independent session, so their round-trips can overlap
+    tools = []
+    for gateway_tools in _gateway_pool.map(load, gateway_urls):
+        tools.extend(gateway_tools)
     return tools
@@ -0,0 +1,56 @@
+"""Shared boto3 clients and DynamoDB table handles.
+
+boto3 clients are thread-safe and are shared process-wide. boto3 resources are
+not, so the DynamoDB resource and its Table handles are cached per thread.
+Either way, repeated store/agent construction reuses one set of pooled HTTPS
+connections instead of re-resolving credentials and endpoints.
+"""
+
+import threading
+from typing import Dict
+
+import boto3
+from botocore.config import Config
+
+_CONFIG = Config(max_pool_connections=50, retries={'mode': 'standard'})
+
+_clients: Dict[str, object] = {}
+# boto3's default session is not safe to use concurrently while creating clients
+_create_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_client(service_name: str):
+    """Get the shared boto3 client for a service."""
+    client = _clients.get(service_name)
+    if client is None:
+        with _create_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _clients[service_name] = boto3.client(service_name, config=_CONFIG)
+    return client
+
+
+def get_sqs_client():
+    """Get the shared SQS client."""
+    return get_client('sqs')
+
+
+def get_dynamodb_resource():
+    """Get this thread's DynamoDB resource."""
+    resource = getattr(_local, 'dynamodb', None)
+    if resource is None:
+        with _create_lock:
+            resource = _local.dynamodb = boto3.resource('dynamodb', config=_CONFIG)
+    return resource
+
+
+def get_table(table_name: str):
+    """Get this thread's Table handle for table_name."""
+    tables = getattr(_local, 'tables', None)
+    if tables is None:
+        tables = _local.tables = {}
+    table = tables.get(table_name)
+    if table is None:
+        table = tables[table_name] = get_dynamodb_resource().Table(table_name)
+    return table
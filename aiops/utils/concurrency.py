@@ -0,0 +1,10 @@
+"""Process-wide limits for async agent entry points."""
+
+import asyncio
+import os
+
+# Max Bedrock-bound calls in flight per process; size to the account's Bedrock RPS quota
+BEDROCK_MAX_CONCURRENCY = int(os.getenv('BEDROCK_MAX_CONCURRENCY', '4'))
+
+# Shared by the Brain, Executor and Evaluator agents
+bedrock_slots = asyncio.Semaphore(BEDROCK_MAX_CONCURRENCY)
@@ -1,6 +1,6 @@
 """Investigation context store for tracking investigation progress."""
 
-import boto3
+from aiops.utils.aws_clients import get_table
 from datetime import datetime
 from typing import Dict, List, Optional
 from decimal import Decimal
@@ -33,9 +33,12 @@ class InvestigationContextStore:
     """Store and update investigation context in DynamoDB (single row per investigation)."""
     
     def __init__(self, table_name: str = None):
-        self.dynamodb = boto3.resource('dynamodb')
         self.table_name = table_name or os.getenv('CONTEXT_TABLE', 'aiops-investigation-context')
-        self.table = self.dynamodb.Table(self.table_name)
+    
+    @property
+    def table(self):
+        """DynamoDB Table handle (shared per thread)"""
+        return get_table(self.table_name)
     
     def create_context(self, investigation_id: str, alarm_summary: Dict) -> None:
         """Initialize investigation context.
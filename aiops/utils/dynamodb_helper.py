@@ -1,17 +1,21 @@
 """DynamoDB helper for storing investigations and workflows."""
 
-import boto3
 from datetime import datetime
 from typing import Dict, List, Optional
 import os
 
+from aiops.utils.aws_clients import get_table
+
 class InvestigationStore:
     """Store and retrieve investigation workflows in DynamoDB."""
     
     def __init__(self, table_name: str = None):
-        self.dynamodb = boto3.resource('dynamodb')
         self.table_name = table_name or os.getenv('INVESTIGATIONS_TABLE', 'aiops-investigations')
-        self.table = self.dynamodb.Table(self.table_name)
+    
+    @property
+    def table(self):
+        """DynamoDB Table handle (shared per thread)"""
+        return get_table(self.table_name)
     
     def save_workflow(self, investigation_id: str, alarm_summary: Dict, tasks: List[Dict]) -> None:
         """Save investigation workflow to DynamoDB.
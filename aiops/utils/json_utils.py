@@ -0,0 +1,51 @@
+"""JSON encode/decode helpers backed by orjson, with a stdlib fallback."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    orjson = None
+    import json
+    JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values the encoder does not handle natively.
+
+    orjson already covers datetime and Enum; DynamoDB Decimals need this hook.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    return json.dumps(obj, default=_default, indent=2 if indent else None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string or bytes; raises JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,45 +1,87 @@
 """Online logging to DynamoDB."""
 
+import atexit
 import os
-import boto3
+import queue
+import threading
 from datetime import datetime
 from typing import Optional
 
+from aiops.utils.aws_clients import get_table
+
 # Check if online logging is enabled
 ONLINE_LOG_ENABLED = os.getenv('ONLINE_LOG', 'false').lower() == 'true'
 LOGS_TABLE = os.getenv('LOGS_TABLE', 'aiops-logs')
+# Human-readable console output, for local runs
+VERBOSE = os.getenv('AIOPS_VERBOSE', 'false').lower() == 'true'
 
-if ONLINE_LOG_ENABLED:
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(LOGS_TABLE)
-else:
-    table = None
+_pending: "queue.Queue[dict]" = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
 
 
 def log(component: str, message: str, level: str = "INFO", investigation_id: Optional[str] = None):
     """Log message to DynamoDB if ONLINE_LOG is enabled.
-    
+
+    The write happens on a background thread, so this never waits on DynamoDB.
+
     Args:
         component: Component name (e.g., "BrainAgent", "ExecutorAgent")
         message: Log message
         level: Log level (INFO, ERROR, WARNING, DEBUG)
         investigation_id: Optional investigation ID for correlation
     """
-    # if not ONLINE_LOG_ENABLED or not table:
-    #     return
-
-    try:
-        item = {
-            'component': component,
-            'time': datetime.utcnow().isoformat(),
-            'level': level,
-            'log': message
-        }
-
-        if investigation_id:
-            item['investigation_id'] = investigation_id
-
-        table.put_item(Item=item)
-    except Exception as e:
-        # Don't fail if logging fails
-        print(f"Failed to write online log: {e}")
+    # Errors and warnings always reach stdout (CloudWatch) as well
+    if VERBOSE or level in ("ERROR", "WARNING"):
+        print(f"[{level}] {component}: {message}")
+    if not ONLINE_LOG_ENABLED:
+        return
+
+    item = {
+        'component': component,
+        'time': datetime.utcnow().isoformat(),
+        'level': level,
+        'log': message
+    }
+
+    if investigation_id:
+        item['investigation_id'] = investigation_id
+
+    _ensure_worker()
+    _pending.put(item)
+
+
+def console(message: str) -> None:
+    """Print a progress line when AIOPS_VERBOSE is set."""
+    if VERBOSE:
+        print(message)
+
+
+def flush() -> None:
+    """Block until every queued log item has been written."""
+    if _worker is not None:
+        _pending.join()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_run, name="online-logger", daemon=True)
+                _worker.start()
+                atexit.register(flush)
+
+
+def _run() -> None:
+    # One PutItem per item: the runtime role only grants PutItem on the logs
+    # table, and items sharing a (component, time) key simply overwrite
+    while True:
+        item = _pending.get()
+        try:
+            get_table(LOGS_TABLE).put_item(Item=item)
+        except Exception as e:
+            # Don't fail if logging fails
+            print(f"Failed to write online log: {e}")
+        finally:
+            _pending.task_done()
@@ -110,8 +110,8 @@ class WorkflowValidator:
         if not isinstance(step.required_data, list):
             errors.append(f"Step {index}: Required data must be a list")
         
-        if not isinstance(step.dependencies, list):
-            errors.append(f"Step {index}: Dependencies must be a list")
+        if not isinstance(step.dependencies, (list, tuple)):
+            errors.append(f"Step {index}: Dependencies must be a list or tuple")
         
         return errors
     
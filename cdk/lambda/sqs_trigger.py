@@ -2,51 +2,85 @@ import json
 import os
 import boto3
 import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+
+# Records in a batch are invoked in parallel; size to the runtime's Bedrock quota
+MAX_CONCURRENT_INVOCATIONS = int(os.environ.get('MAX_CONCURRENT_INVOCATIONS', '10'))
+# Longest single invoke_agent_runtime call; retries are handled below
+INVOKE_TIMEOUT = int(os.environ.get('AGENT_INVOKE_TIMEOUT', '240'))
+# Time kept in reserve to return the batch response before the Lambda times out
+RESPONSE_MARGIN_MS = 10_000
+
+bedrock_agentcore = boto3.client(
+    'bedrock-agentcore',
+    config=Config(read_timeout=INVOKE_TIMEOUT, retries={'total_max_attempts': 1})
+)
+
+
+def invoke_with_retry(agent_runtime_arn, record, context):
+    """Invoke the AgentCore Runtime for one SQS record.
+
+    An attempt is only started if it can finish before the Lambda times out, so
+    a slow record is reported as failed instead of timing out the whole batch
+    (which would redeliver records that already succeeded).
+
+    Returns None on success, or a failure entry when all retries are exhausted.
+    """
+    message_body = record['body']
+    message_id = record['messageId']
+
+    # Retry logic with exponential backoff
+    max_retries = 3
+    retry_delay = 1  # seconds
+
+    for attempt in range(max_retries):
+        if context.get_remaining_time_in_millis() < INVOKE_TIMEOUT * 1000 + RESPONSE_MARGIN_MS:
+            print(f"⏱️ Not enough time left to invoke {message_id}; leaving it for redelivery")
+            return {
+                'itemIdentifier': message_id,
+                'error': 'Lambda time budget exhausted'
+            }
+
+        try:
+            response = bedrock_agentcore.invoke_agent_runtime(
+                agentRuntimeArn=agent_runtime_arn,
+                qualifier='DEFAULT',
+                payload=message_body.encode('utf-8')
+            )
+
+            print(f"✅ Invoked AgentCore Runtime (attempt {attempt + 1}): {message_id}")
+            return None
+
+        except Exception as e:
+            print(f"❌ Attempt {attempt + 1} failed for {message_id}: {str(e)}")
+
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+            else:
+                # All retries failed
+                print(f"🚫 All retries exhausted for {message_id}")
+                return {
+                    'itemIdentifier': message_id,
+                    'error': str(e)
+                }
 
-bedrock_agentcore = boto3.client('bedrock-agentcore')
 
 def lambda_handler(event, context):
     agent_runtime_arn = os.environ['AGENT_RUNTIME_ARN']
     print(event)
-    failed_messages = []
-    
-    for record in event['Records']:
-        message_body = record['body']
-        message_id = record['messageId']
-        
-        # Retry logic with exponential backoff
-        max_retries = 3
-        retry_delay = 1  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                response = bedrock_agentcore.invoke_agent_runtime(
-                    agentRuntimeArn=agent_runtime_arn,
-                    qualifier='DEFAULT',
-                    payload=message_body.encode('utf-8')
-                )
-                
-                print(f"✅ Invoked AgentCore Runtime (attempt {attempt + 1}): {message_id}")
-                break  # Success, exit retry loop
-
-            except Exception as e:
-                print(f"❌ Attempt {attempt + 1} failed for {message_id}: {str(e)}")
-                
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    # All retries failed
-                    print(f"🚫 All retries exhausted for {message_id}")
-                    failed_messages.append({
-                        'itemIdentifier': message_id,
-                        'error': str(e)
-                    })
-    
+    records = event['Records']
+
+    # Invocations are network-bound, so threads overlap them despite the GIL
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_INVOCATIONS, len(records)))) as pool:
+        results = pool.map(lambda record: invoke_with_retry(agent_runtime_arn, record, context), records)
+        failed_messages = [failure for failure in results if failure]
+
     # Return partial batch failure for SQS to retry failed messages
     if failed_messages:
         return {
             'batchItemFailures': [{'itemIdentifier': msg['itemIdentifier']} for msg in failed_messages]
         }
-    
+
     return {'statusCode': 200}
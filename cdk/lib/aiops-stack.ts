@@ -176,7 +176,7 @@ export class AIOpsStack extends cdk.Stack {
             new iam.PolicyStatement({
               effect: iam.Effect.ALLOW,
               actions: [
-                'dynamodb:GetItem', 'dynamodb:PutItem', 'dynamodb:UpdateItem',
+                'dynamodb:GetItem', 'dynamodb:BatchGetItem', 'dynamodb:PutItem', 'dynamodb:UpdateItem',
                 'dynamodb:Query', 'dynamodb:Scan'
               ],
               resources: [
@@ -438,14 +438,19 @@ export class AIOpsStack extends cdk.Stack {
       runtime: lambda.Runtime.PYTHON_3_11,
       handler: 'sqs_trigger.lambda_handler',
       code: lambda.Code.fromAsset('lambda'),
-      timeout: cdk.Duration.seconds(60),
+      // Records are invoked in parallel and each invocation waits for the agent,
+      // so allow several invoke attempts (AGENT_INVOKE_TIMEOUT each); must not
+      // exceed the queue's visibility timeout
+      timeout: cdk.Duration.minutes(15),
       environment: {
-        AGENT_RUNTIME_ARN: this.agentRuntime.attrAgentRuntimeArn
+        AGENT_RUNTIME_ARN: this.agentRuntime.attrAgentRuntimeArn,
+        AGENT_INVOKE_TIMEOUT: '240'
       }
     });
 
     fn.addEventSource(new lambdaEventSources.SqsEventSource(this.investigationQueue, {
-      batchSize: 1
+      batchSize: 10,
+      reportBatchItemFailures: true
     }));
 
     fn.addToRolePolicy(new iam.PolicyStatement({
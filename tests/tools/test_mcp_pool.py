@@ -0,0 +1,178 @@
+"""Tests for the pooled MCP gateway sessions (no AWS access needed)."""
+
+import sys
+import os
+import importlib
+import threading
+import types
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pytest
+
+# aiops.tools re-exports the pool instance under the module's own name
+mcp_pool_module = importlib.import_module('aiops.tools.mcp_pool')
+MCPClientPool = mcp_pool_module.MCPClientPool
+
+
+class FakeToolPage(list):
+    pagination_token = None
+
+
+class FakeMCPClient:
+    """Stands in for strands' MCPClient: started/stopped via the context protocol."""
+
+    def __init__(self, gateway_url, region):
+        self.gateway_url = gateway_url
+        self.region = region
+        self.started = False
+        self.closed = False
+        self.list_calls = 0
+
+    def __enter__(self):
+        self.started = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+    def list_tools_sync(self, pagination_token=None):
+        self.list_calls += 1
+        return FakeToolPage(["tool-a", "tool-b"])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(mcp_pool_module, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    created = []
+
+    def create(gateway_url, region=None):
+        client = FakeMCPClient(gateway_url, region)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(mcp_pool_module, "create_gateway_mcp_client", create)
+    return created
+
+
+def test_released_session_is_reused(clock, clients):
+    pool = MCPClientPool()
+    with pool.acquire("https://gw") as first:
+        assert first.client.started
+    with pool.acquire("https://gw") as second:
+        assert second is first
+    assert len(clients) == 1
+
+
+def test_tool_listing_is_cached_per_session(clock, clients):
+    pool = MCPClientPool()
+    with pool.acquire("https://gw") as session:
+        assert session.tools() == ["tool-a", "tool-b"]
+        assert session.tools() == ["tool-a", "tool-b"]
+        assert clients[0].list_calls == 1
+        clock.now += mcp_pool_module.TOOLS_TTL + 1
+        session.tools()
+        assert clients[0].list_calls == 2
+
+
+def test_sessions_are_keyed_by_region(clock, clients):
+    pool = MCPClientPool()
+    with pool.acquire("https://gw", "us-east-1"):
+        pass
+    with pool.acquire("https://gw", "eu-west-1") as other:
+        assert other.client.region == "eu-west-1"
+    assert [c.region for c in clients] == ["us-east-1", "eu-west-1"]
+
+
+def test_checkout_blocks_at_capacity_until_release(clients):
+    pool = MCPClientPool(max_sessions=2)
+    acquired = threading.Event()
+    waiter_session = []
+
+    def waiter():
+        with pool.acquire("https://gw") as session:
+            waiter_session.append(session)
+            acquired.set()
+
+    first_cm = pool.acquire("https://gw")
+    first = first_cm.__enter__()
+    with pool.acquire("https://gw"):
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not acquired.wait(0.2)
+        assert len(clients) == 2
+        first_cm.__exit__(None, None, None)
+        assert acquired.wait(2)
+    thread.join(2)
+
+    assert waiter_session == [first]
+    assert len(clients) == 2
+
+
+def test_idle_session_is_evicted(clock, clients):
+    pool = MCPClientPool(idle_timeout=60, max_age=300)
+    with pool.acquire("https://gw"):
+        pass
+    clock.now += 61
+    with pool.acquire("https://gw") as session:
+        assert session.client is clients[1]
+    assert clients[0].closed
+
+
+def test_old_session_is_retired_despite_regular_use(clock, clients):
+    pool = MCPClientPool(idle_timeout=60, max_age=300)
+    for _ in range(8):
+        with pool.acquire("https://gw"):
+            pass
+        clock.now += 50
+    assert len(clients) == 2
+    assert clients[0].closed
+    assert not clients[1].closed
+
+
+def test_session_is_discarded_when_block_raises(clock, clients):
+    pool = MCPClientPool(max_sessions=1)
+    with pytest.raises(RuntimeError):
+        with pool.acquire("https://gw"):
+            raise RuntimeError("tool call failed")
+    assert clients[0].closed
+
+    # The slot was returned, so a new session can be opened
+    with pool.acquire("https://gw") as session:
+        assert session.client is clients[1]
+    assert pool._open[("https://gw", None)] == 1
+
+
+def test_slot_is_returned_when_connect_fails(clock, monkeypatch):
+    pool = MCPClientPool(max_sessions=1)
+
+    def fail(gateway_url, region=None):
+        raise ConnectionError("gateway unreachable")
+
+    monkeypatch.setattr(mcp_pool_module, "create_gateway_mcp_client", fail)
+    with pytest.raises(ConnectionError):
+        with pool.acquire("https://gw"):
+            pass
+    assert pool._open[("https://gw", None)] == 0
+
+
+def test_close_closes_idle_sessions(clock, clients):
+    pool = MCPClientPool()
+    with pool.acquire("https://gw"):
+        pass
+    pool.close()
+    assert clients[0].closed
+    assert pool._open[("https://gw", None)] == 0